@@ -5,6 +5,7 @@ This is a simplified example that demonstrates the integration pattern.
 """
 
 import sys
+import re
 import json
 from typing import Dict, Any, List
 import os
@@ -14,6 +15,15 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from kym_scraper.ai_integration import KYMAgentTool
 
+# Compiled routing patterns - one scan of the request instead of repeated
+# lower() copies and substring checks per branch
+_ROUTER = re.compile(
+    r"(?P<newest>newest|latest)|(?P<details>details.*url|url.*details)",
+    re.IGNORECASE | re.DOTALL
+)
+_LIMIT_RE = re.compile(r"limit\s+(\d+)", re.IGNORECASE)
+_URL_RE = re.compile(r"https?://\S+")
+
 class SimpleAgent:
     """
     A simple AI agent that can use the KYM tool.
@@ -51,18 +61,17 @@ class SimpleAgent:
             Response dictionary with tool results
         """
         # This is where an LLM would determine what tool to use
-        # For this example, we'll use simple keyword matching
-        
-        if "newest" in request.lower() or "latest" in request.lower():
+        # For this example, we'll use simple keyword matching via a single
+        # compiled pattern, dispatching on which named group matched
+        match = _ROUTER.search(request)
+
+        if match and match.group("newest"):
             # Extract limit parameter (in a real agent, an LLM would do this)
             limit = 5  # Default
-            if "limit" in request.lower():
-                # Simple extraction - a real agent would use NLP
-                try:
-                    limit = int(request.split("limit")[1].split()[0])
-                except (IndexError, ValueError):
-                    pass
-            
+            limit_match = _LIMIT_RE.search(request)
+            if limit_match:
+                limit = int(limit_match.group(1))
+
             # Call the tool
             memes = self.tools["get_newest_memes"](limit=limit)
             
@@ -74,17 +83,11 @@ class SimpleAgent:
                 "response": f"Here are the {limit} newest memes from Know Your Meme:"
             }
             
-        elif "details" in request.lower() and "url" in request.lower():
+        elif match and match.group("details"):
             # Extract URL parameter (in a real agent, an LLM would do this)
-            url = None
-            if "http" in request:
-                # Simple extraction - a real agent would use NLP
-                try:
-                    url = request.split("http")[1].strip()
-                    url = "http" + url.split()[0]
-                except (IndexError, ValueError):
-                    url = None
-            
+            url_match = _URL_RE.search(request)
+            url = url_match.group(0) if url_match else None
+
             if not url:
                 return {
                     "error": "Could not extract URL from request",
@@ -4,5 +4,5 @@ Know Your Meme Scraper for AI Agents
 
 __version__ = "0.1.0"
 
-from .scraper import scrape_newest_memes, get_meme_html
-from .agent import get_newest_memes, get_meme_details, agent_main 
\ No newline at end of file
+from .scraper import scrape_newest_memes, iter_newest_memes, get_meme_html, get_meme_html_batch, aget_meme_html
+from .agent import get_newest_memes, get_meme_details, get_meme_details_batch, aget_meme_details, agent_main 
\ No newline at end of file
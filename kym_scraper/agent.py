@@ -4,7 +4,7 @@ AI Agent interface for the Know Your Meme scraper.
 This module provides functions that can be easily called from AI agents.
 """
 from typing import List, Dict, Any, Optional
-from .scraper import scrape_newest_memes, get_meme_html
+from .scraper import scrape_newest_memes, get_meme_html, get_meme_html_batch, aget_meme_html
 
 def get_newest_memes(limit: int = 5) -> List[Dict[str, Any]]:
     """
@@ -18,17 +18,45 @@ def get_newest_memes(limit: int = 5) -> List[Dict[str, Any]]:
     """
     return scrape_newest_memes(limit=limit)
 
-def get_meme_details(url: str) -> Dict[str, Any]:
+def get_meme_details(url: str, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Get the HTML content of a specific meme page and extract key details.
-    
+
     Args:
         url: URL of the meme to fetch details for
-        
+        force_refresh: If True, bypass the on-disk cache and refetch
+
+    Returns:
+        Dictionary with meme details and full HTML
+    """
+    result = get_meme_html(url, force_refresh=force_refresh)
+    return result
+
+def get_meme_details_batch(urls: List[str], max_workers: int = 8) -> List[Dict[str, Any]]:
+    """
+    Get the HTML content for several meme pages in one call.
+
+    Args:
+        urls: URLs of the memes to fetch details for
+        max_workers: Maximum number of concurrent fetches
+
+    Returns:
+        List of detail dictionaries, in the same order as urls
+    """
+    return get_meme_html_batch(urls, max_workers=max_workers)
+
+async def aget_meme_details(url: str, session) -> Dict[str, Any]:
+    """
+    Async variant of get_meme_details, for fetching many memes concurrently.
+
+    Args:
+        url: URL of the meme to fetch details for
+        session: An open aiohttp.ClientSession shared by the batch
+
     Returns:
         Dictionary with meme details and full HTML
     """
-    result = get_meme_html(url)
+    result = await aget_meme_html(url, session)
     return result
 
 def agent_main(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -57,11 +85,19 @@ def agent_main(action: str, params: Optional[Dict[str, Any]] = None) -> Dict[str
         
         details = get_meme_details(url)
         return {"status": "success", "data": details}
-    
+
+    elif action == "get_meme_details_batch":
+        urls = params.get("urls")
+        if not urls:
+            return {"status": "error", "message": "urls is required for get_meme_details_batch action"}
+
+        details = get_meme_details_batch(urls)
+        return {"status": "success", "data": details}
+
     else:
         return {
-            "status": "error", 
-            "message": f"Unknown action: {action}. Available actions: get_newest_memes, get_meme_details"
+            "status": "error",
+            "message": f"Unknown action: {action}. Available actions: get_newest_memes, get_meme_details, get_meme_details_batch"
         }
 
 # Example usage when run directly (not as an imported module)
@@ -86,4 +122,8 @@ if __name__ == "__main__":
             sys.exit(1)
     
     result = agent_main(action, params)
-    print(json.dumps(result, indent=2)) 
\ No newline at end of file
+    # HTML payloads are raw bytes - decode them for the JSON output
+    print(json.dumps(
+        result, indent=2,
+        default=lambda obj: obj.decode("utf-8", "replace") if isinstance(obj, (bytes, bytearray)) else str(obj)
+    )) 
\ No newline at end of file
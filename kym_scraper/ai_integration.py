@@ -4,10 +4,85 @@ Integration module for using the Know Your Meme scraper with AI frameworks.
 This provides examples for integrating with different AI agent frameworks.
 """
 
+import copy
 import json
 from typing import Dict, Any, List, Optional, Callable
 from .agent import agent_main
 
+# Tool definitions in OpenAI function calling format, built once at import -
+# frameworks re-request these during registration and the literal is large
+_TOOL_FUNCTIONS = (
+    {
+        "type": "function",
+        "function": {
+            "name": "get_newest_memes",
+            "description": "Get the newest memes from Know Your Meme",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of memes to return"
+                    }
+                },
+                "required": []
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_meme_details",
+            "description": "Get details for a specific meme",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "url": {
+                        "type": "string",
+                        "description": "URL of the meme to fetch details for"
+                    }
+                },
+                "required": ["url"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_meme_details_batch",
+            "description": "Get details for several memes in one call, fetched concurrently",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "urls": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "URLs of the memes to fetch details for"
+                    }
+                },
+                "required": ["urls"]
+            }
+        }
+    },
+)
+
+# Static schema for the LangChain-style tool wrapper
+_LANGCHAIN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "action": {
+            "type": "string",
+            "enum": ["get_newest_memes", "get_meme_details", "get_meme_details_batch"],
+            "description": "The action to perform"
+        },
+        "params": {
+            "type": "object",
+            "description": "Parameters for the action"
+        }
+    },
+    "required": ["action"]
+}
+
 class KYMAgentTool:
     """
     Tool class for integrating KYM scraper with AI agent frameworks.
@@ -28,78 +103,66 @@ class KYMAgentTool:
         result = agent_main("get_meme_details", {"url": url})
         return result["data"]
 
+    def get_meme_details_batch(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Get details for several memes concurrently in one tool call."""
+        result = agent_main("get_meme_details_batch", {"urls": urls})
+        return result["data"]
+
     def get_tool_functions(self) -> List[Dict[str, Any]]:
         """
         Return tool definitions in OpenAI function calling format.
         This format works with many AI frameworks.
+
+        Returns a deep copy so callers can mutate their definitions without
+        corrupting the shared module-level constant.
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_newest_memes",
-                    "description": "Get the newest memes from Know Your Meme",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of memes to return"
-                            }
-                        },
-                        "required": []
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "get_meme_details",
-                    "description": "Get details for a specific meme",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "url": {
-                                "type": "string",
-                                "description": "URL of the meme to fetch details for"
-                            }
-                        },
-                        "required": ["url"]
-                    }
-                }
-            }
-        ]
+        return copy.deepcopy(list(_TOOL_FUNCTIONS))
+
+# KYMAgentTool holds no per-instance state, so one shared instance serves
+# every registration helper below
+_DEFAULT_TOOL = KYMAgentTool()
+
+# Action name -> bound method, resolved once instead of string-dispatching
+# through agent_main on every invocation
+_DISPATCH = {
+    "get_newest_memes": _DEFAULT_TOOL.get_newest_memes,
+    "get_meme_details": _DEFAULT_TOOL.get_meme_details,
+    "get_meme_details_batch": _DEFAULT_TOOL.get_meme_details_batch,
+}
+
+
+def _dispatch_action(params: Dict[str, Any]) -> Any:
+    """
+    Route a LangChain-style tool call to the matching bound method.
+
+    Action names arrive from an LLM at runtime, so an unknown one is
+    expected input - return the structured error agent_main would have
+    produced instead of raising a KeyError.
+    """
+    action = params.get("action")
+    handler = _DISPATCH.get(action)
+    if handler is None:
+        return {
+            "status": "error",
+            "message": f"Unknown action: {action}. Available actions: {', '.join(_DISPATCH)}"
+        }
+    return handler(**params.get("params", {}))
+
 
 # Example: Implementation for LangChain-style framework
 def create_langchain_tool():
     """
     Create a tool compatible with LangChain-style frameworks.
-    
+
     Returns:
         Dict containing tool configuration
     """
-    kym_tool = KYMAgentTool()
-    
     # This is a template - actual implementation would depend on the framework
     return {
         "name": "know_your_meme",
         "description": "Tool for retrieving information about internet memes.",
-        "func": lambda params: agent_main(params["action"], params["params"]),
-        "schema": {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["get_newest_memes", "get_meme_details"],
-                    "description": "The action to perform"
-                },
-                "params": {
-                    "type": "object",
-                    "description": "Parameters for the action"
-                }
-            },
-            "required": ["action"]
-        }
+        "func": _dispatch_action,
+        "schema": _LANGCHAIN_SCHEMA
     }
 
 # Example: Implementation for direct function calling
@@ -110,11 +173,8 @@ def register_agent_callbacks(callback_registry: Dict[str, Callable]):
     Args:
         callback_registry: Dictionary to register callbacks to
     """
-    kym_tool = KYMAgentTool()
-    
-    callback_registry["get_newest_memes"] = kym_tool.get_newest_memes
-    callback_registry["get_meme_details"] = kym_tool.get_meme_details
-    
+    callback_registry.update(_DISPATCH)
+
     return callback_registry
 
 # Example usage when run directly
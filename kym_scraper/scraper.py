@@ -1,104 +1,367 @@
+import asyncio
+import os
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter, Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import re
-from typing import List, Dict, Any
+import xml.etree.ElementTree as ET
+from typing import List, Dict, Any, Iterator, Optional
 
-def scrape_newest_memes(limit: int = 20, return_html_on_failure: bool = False) -> List[Dict[str, Any]]:
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# Small in-memory TTL caches in front of the network layer - agent sessions
+# frequently repeat identical queries within seconds, which these turn into
+# dict lookups. Error responses are never stored.
+_detail_cache = TTLCache(maxsize=256, ttl=300) if TTLCache is not None else None
+_listing_cache = TTLCache(maxsize=8, ttl=60) if TTLCache is not None else None
+
+# Prefer the C-backed lxml parser for BeautifulSoup - tokenizing the KYM
+# index page is the hot path here and lxml is several times faster than the
+# pure-Python html.parser, which stays as the fallback for existing installs
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = "lxml"
+except ImportError:
+    _BS4_PARSER = "html.parser"
+
+# selectolax (Lexbor) parses and CSS-selects entirely in C, roughly 10-20x
+# faster than BeautifulSoup for the enumerate-anchors-and-read-attributes
+# pattern the listing scraper needs; BeautifulSoup remains the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# The whole link-acceptance predicate as one compiled pattern: a meme page
+# href, not a listing sub-page (new/trending/confirmed), not a category and
+# not pagination. One C-level regex match replaces the old chain of
+# startswith/substring/regex checks per anchor.
+_MEME_HREF_RE = re.compile(
+    r"^(?!.*/categories/)"          # no category links anywhere in the path
+    r"(?!.*(?:/page/|\?page=)\d+)"  # no pagination in either style
+    r"/memes/(?!new|trending|confirmed)"
+)
+
+# Restrict BeautifulSoup tree construction to accepted meme anchors - the
+# listing page is mostly divs/scripts/SVG that the scraper never looks at,
+# and with the full predicate in the strainer the bs4 path filters while
+# the tree is being built
+_A_STRAINER = SoupStrainer("a", href=_MEME_HREF_RE)
+
+# On-disk cache for meme pages - KYM pages are near-static, so re-running a
+# pipeline shouldn't refetch the same URLs. HTML is stored zlib-compressed
+# (KYM pages compress 5-8x). Caching is skipped entirely if diskcache is not
+# installed or the cache directory cannot be created.
+_CACHE_TTL = 3600  # seconds
+if diskcache is not None:
+    try:
+        _CACHE = diskcache.Cache(os.path.expanduser("~/.cache/kym_scraper"))
+    except OSError:
+        _CACHE = None
+else:
+    _CACHE = None
+
+# Browser-like headers shared by every fetch in this module
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+# Shared session so repeated fetches reuse one keep-alive connection instead
+# of paying the TCP+TLS handshake for every meme page
+_SESSION = requests.Session()
+_SESSION.headers.update(_DEFAULT_HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+def _iter_meme_anchors(content: bytes):
     """
-    Scrapes the newest memes from Know Your Meme website.
-    
-    Args:
-        limit: Maximum number of memes to return
-        return_html_on_failure: If True and no memes are found, returns the raw HTML
-        
-    Returns:
-        List of dictionaries containing meme information including title and URL
+    Yield (href, attributes, text) for every meme anchor on a listing page.
+
+    Uses the Lexbor parser when selectolax is installed (the parse and the
+    CSS selection both run in C), otherwise falls back to BeautifulSoup.
     """
-    url = "https://knowyourmeme.com/memes?kind=submissions&sort=newest"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Cache-Control": "max-age=0",
-    }
-    
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code != 200:
-        return [{"error": f"Failed to fetch data: Status code {response.status_code}"}]
-    
-    soup = BeautifulSoup(response.text, "html.parser")
-    
-    # Based on our debug results, we know these selectors work
-    results = []
-    
-    # Look for meme links - this works according to our debugging
-    meme_links = soup.select("a[href*='/memes/']")
-    
-    for link in meme_links:
-        href = link.get("href", "")
-        
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(content)
+        for anchor in tree.css("a[href*='/memes/']"):
+            attrs = anchor.attributes
+            yield attrs.get("href") or "", attrs, anchor.text(strip=True)
+    else:
+        soup = BeautifulSoup(content, _BS4_PARSER, parse_only=_A_STRAINER)
+        # The strainer already filtered to meme anchors, so no select() pass
+        for link in soup.find_all("a"):
+            yield link.get("href", ""), link.attrs, link.text.strip()
+
+
+_BASE = "https://knowyourmeme.com"
+_LISTING_URL = _BASE + "/memes?kind=submissions&sort=newest"
+_FEED_URL = _BASE + "/memes.rss?sort=newest"
+
+# Interned result-dict keys - every meme dict in the hot loop shares the
+# same key objects instead of fresh lookups
+_TITLE = sys.intern("title")
+_URL = sys.intern("url")
+
+# HTTP validators plus the matching parsed results for the listing page.
+# With these, a repeat fetch becomes a conditional GET: on 304 Not Modified
+# the server sends no body and we skip the download and the parse entirely.
+_listing_validators = {"etag": None, "last_modified": None, "parsed": None, "limit": 0}
+
+
+def _copy_memes(memes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Per-dict copies of a cached meme list.
+
+    The listing caches hold plain dicts, so handing the stored objects to
+    callers would let in-place mutation corrupt the cache - same rule as
+    the detail-cache path in get_meme_html.
+    """
+    return [dict(meme) for meme in memes]
+
+
+def _fetch_listing(limit: int):
+    """
+    Fetch the listing page, conditionally when we hold usable validators.
+
+    Returns (response, cached) where cached is the previously parsed meme
+    list (trimmed to limit) if the server replied 304 Not Modified, else
+    None. Validators are only sent when the stored parse covers the
+    requested limit, since a 304 carries no body to re-parse.
+    """
+    headers = {}
+    validators = _listing_validators
+    if validators["parsed"] is not None and limit <= validators["limit"]:
+        if validators["etag"]:
+            headers["If-None-Match"] = validators["etag"]
+        if validators["last_modified"]:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = _SESSION.get(_LISTING_URL, headers=headers or None, timeout=(3.05, 10))
+
+    if response.status_code == 304 and validators["parsed"] is not None:
+        return response, _copy_memes(validators["parsed"][:limit])
+
+    return response, None
+
+
+def _store_listing_validators(response, results: List[Dict[str, Any]], limit: int) -> None:
+    """Remember the response validators and the parse they correspond to."""
+    _listing_validators.update({
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "parsed": results,
+        "limit": limit,
+    })
+
+
+def _iter_parsed_memes(content: bytes) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield unique meme dicts from a listing page as anchors are parsed.
+    """
+    seen_urls = set()
+
+    for href, attrs, text in _iter_meme_anchors(content):
         # Exclude links that are not actual meme pages:
         # - Not pagination links (containing 'page/' or '?page=')
         # - Not category or submission links
         # - Only actual meme pages
-        if (href.startswith("/memes/") and 
-            not href.startswith("/memes/new") and
-            not href.startswith("/memes/trending") and
-            not href.startswith("/memes/confirmed") and
-            not re.search(r'/page/\d+', href) and
-            not re.search(r'\?page=\d+', href) and
-            "/categories/" not in href):
-            
+        if _MEME_HREF_RE.match(href):
+
             # Try to get title from different attributes
             title = (
-                link.get("alt") or 
-                link.get("title") or 
-                link.get("data-author") or
-                link.text.strip() or
+                attrs.get("alt") or
+                attrs.get("title") or
+                attrs.get("data-author") or
+                text or
                 href.split("/")[-1].replace("-", " ").title() or
                 "Unknown Meme"
             )
-            
-            # We found links with class "item" that seem to be meme entries
-            if link.get("class") and "item" in link.get("class"):
-                title = link.get("alt") or title
-            
-            full_url = f"https://knowyourmeme.com{href}" if href.startswith("/") else href
-            
-            # Only add if this URL isn't already in results
-            # And make sure it's not just a number (pagination)
-            if (not any(r["url"] == full_url for r in results) and 
-                not title.isdigit()):
-                results.append({
-                    "title": title,
-                    "url": full_url
-                })
-    
-    # Limit the results
-    results = results[:limit]
-    
+
+            # Accepted hrefs always start with /memes/, so plain
+            # concatenation beats building an f-string per anchor
+            full_url = _BASE + href
+
+            # Skip URLs we've already collected (set lookup instead of
+            # rescanning the results list) and bare numbers (pagination)
+            if full_url in seen_urls or title.isdigit():
+                continue
+
+            seen_urls.add(full_url)
+            yield {
+                _TITLE: title,
+                _URL: full_url
+            }
+
+
+def _fetch_feed_memes(limit: int) -> Optional[List[Dict[str, Any]]]:
+    """
+    Try to read the newest memes from the KYM RSS feed.
+
+    The feed is a few KB of XML with title+link already structured - orders
+    of magnitude less data than the HTML index page and no HTML parsing or
+    CSS selection at all. Returns None on any failure (non-200, malformed
+    XML, empty feed) so callers can fall back to the HTML path.
+    """
+    # Mirror the HTML path's islice(..., max(limit, 0)) behaviour for
+    # non-positive limits instead of hitting the network for nothing
+    if limit <= 0:
+        return []
+
+    try:
+        response = _SESSION.get(_FEED_URL, timeout=(3.05, 10))
+    except requests.RequestException:
+        return None
+
+    if response.status_code != 200:
+        return None
+
+    try:
+        root = ET.fromstring(response.content)
+    except ET.ParseError:
+        return None
+
+    results = []
+    for item in root.findall(".//item"):
+        title = item.findtext("title")
+        link = item.findtext("link")
+        if title and link:
+            results.append({_TITLE: title.strip(), _URL: link.strip()})
+            if len(results) >= limit:
+                break
+
+    return results or None
+
+
+def iter_newest_memes(limit: int = 20) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yields the newest memes from Know Your Meme.
+
+    Generator counterpart of scrape_newest_memes for callers that consume
+    memes one at a time - anchor parsing stops as soon as the consumer does
+    (or when limit unique memes have been yielded).
+
+    Args:
+        limit: Maximum number of memes to yield
+
+    Yields:
+        Dictionaries containing meme information including title and URL
+    """
+    if _listing_cache is not None:
+        cached = _listing_cache.get(limit)
+        if cached is not None:
+            yield from _copy_memes(cached)
+            return
+
+    feed_results = _fetch_feed_memes(max(limit, 0))
+    if feed_results is not None:
+        if _listing_cache is not None:
+            _listing_cache[limit] = feed_results
+        yield from _copy_memes(feed_results)
+        return
+
+    response, not_modified = _fetch_listing(limit)
+
+    if not_modified is not None:
+        yield from not_modified
+        return
+
+    if response.status_code != 200:
+        yield {"error": f"Failed to fetch data: Status code {response.status_code}"}
+        return
+
+    yield from islice(_iter_parsed_memes(response.content), max(limit, 0))
+
+
+def scrape_newest_memes(limit: int = 20, return_html_on_failure: bool = False) -> List[Dict[str, Any]]:
+    """
+    Scrapes the newest memes from Know Your Meme website.
+
+    Args:
+        limit: Maximum number of memes to return
+        return_html_on_failure: If True and no memes are found, returns the raw HTML
+
+    Returns:
+        List of dictionaries containing meme information including title and URL
+    """
+    if _listing_cache is not None:
+        cached = _listing_cache.get(limit)
+        if cached is not None:
+            return _copy_memes(cached)
+
+    # Prefer the RSS feed; fall back to scraping the HTML index only when
+    # the feed is unavailable or empty
+    feed_results = _fetch_feed_memes(max(limit, 0))
+    if feed_results is not None:
+        if _listing_cache is not None:
+            _listing_cache[limit] = feed_results
+        return _copy_memes(feed_results)
+
+    response, not_modified = _fetch_listing(limit)
+
+    if not_modified is not None:
+        return not_modified
+
+    if response.status_code != 200:
+        return [{"error": f"Failed to fetch data: Status code {response.status_code}"}]
+
+    # islice stops the anchor parsing as soon as limit memes are collected
+    results = list(islice(_iter_parsed_memes(response.content), max(limit, 0)))
+
     # If no results were found and return_html_on_failure is True
     if len(results) == 0 and return_html_on_failure:
-        return [{"error": "No memes found", "html": response.text}]
-    
+        # Raw bytes, matching get_meme_html - no charset detection pass
+        return [{"error": "No memes found", "html": response.content}]
+
+    if results:
+        if _listing_cache is not None:
+            _listing_cache[limit] = results
+        _store_listing_validators(response, results, limit)
+        return _copy_memes(results)
+
     return results
 
 
-def get_meme_html(url: str) -> Dict[str, Any]:
+def get_meme_html(url: str, force_refresh: bool = False) -> Dict[str, Any]:
     """
     Fetches the HTML content of a specific meme URL.
-    
+
+    Successful fetches are cached on disk for an hour, so repeat runs over
+    the same URLs return in microseconds instead of a full HTTPS round trip.
+
     Args:
         url: The URL of the meme page to scrape
-        
+        force_refresh: If True, bypass the cache and fetch the page again
+
     Returns:
         Dict with HTML content if successful, or error information
         {
-            "html": str,           # The full HTML content of the page
+            "html": bytes,         # The full HTML content of the page (raw bytes)
             "status_code": int,    # HTTP status code
             "url": str,            # The URL that was fetched (in case of redirects)
             "error": str           # Error message (only present if there was an error)
@@ -106,35 +369,127 @@ def get_meme_html(url: str) -> Dict[str, Any]:
     """
     # Make sure the URL is valid and points to Know Your Meme
     if not url.startswith("http"):
-        url = f"https://knowyourmeme.com{url}" if url.startswith("/") else f"https://knowyourmeme.com/{url}"
-    
-    # Use the same headers as the main scraper function
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1"
-    }
-    
+        url = _BASE + url if url.startswith("/") else f"{_BASE}/{url}"
+
+    if not force_refresh:
+        # Memory cache first, then the on-disk cache
+        if _detail_cache is not None:
+            cached = _detail_cache.get(url)
+            if cached is not None:
+                # Copy so in-place mutation by the caller can't corrupt the
+                # cached entry for everyone else
+                return dict(cached)
+
+        if _CACHE is not None:
+            cached = _CACHE.get(url)
+            if cached is not None:
+                result = dict(cached)
+                result["html"] = zlib.decompress(result["html"])
+                if _detail_cache is not None:
+                    _detail_cache[url] = dict(result)
+                return result
+
     try:
-        response = requests.get(url, headers=headers)
-        
+        # The shared session already carries _DEFAULT_HEADERS. stream=True
+        # keeps urllib3 from preloading the body into its own buffer; the
+        # chunks are joined straight into the one bytes object we return.
+        response = _SESSION.get(url, timeout=(3.05, 10), stream=True)
+        html = b"".join(response.iter_content(chunk_size=65536))
+
+        # Return the raw bytes - every token downstream callers search for
+        # is ASCII, so skipping the UTF-8 decode saves a full-page str
+        # allocation per meme
         result = {
-            "html": response.text,
+            "html": html,
             "status_code": response.status_code,
             "url": response.url
         }
         
         if response.status_code != 200:
             result["error"] = f"Failed to fetch URL: HTTP {response.status_code}"
-        
+        else:
+            # Only cache successful fetches so transient failures don't
+            # poison the caches
+            if _detail_cache is not None:
+                _detail_cache[url] = dict(result)
+            if _CACHE is not None:
+                cached = dict(result)
+                cached["html"] = zlib.compress(result["html"])
+                _CACHE.set(url, cached, expire=_CACHE_TTL)
+
         return result
         
     except requests.RequestException as e:
         return {
-            "html": "",
+            "html": b"",
+            "status_code": 0,
+            "url": url,
+            "error": f"Request error: {str(e)}"
+        }
+
+
+def get_meme_html_batch(urls: List[str], max_workers: int = 8) -> List[Dict[str, Any]]:
+    """
+    Fetches several meme pages concurrently.
+
+    The shared session is thread-safe for separate requests and its
+    connection pool covers the worker count, so parallel fetches reuse the
+    keep-alive sockets while overlapping the network waits.
+
+    Args:
+        urls: The URLs of the meme pages to scrape
+        max_workers: Maximum number of concurrent fetches
+
+    Returns:
+        List of get_meme_html result dicts, in the same order as urls
+    """
+    if not urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(get_meme_html, urls))
+
+
+async def aget_meme_html(url: str, session: "aiohttp.ClientSession") -> Dict[str, Any]:
+    """
+    Async variant of get_meme_html for fetching many meme pages concurrently.
+
+    Requires aiohttp. The caller owns the ClientSession, so a whole batch of
+    fetches shares one connection pool (and one TLS handshake per host).
+
+    Args:
+        url: The URL of the meme page to scrape
+        session: An open aiohttp.ClientSession to fetch through
+
+    Returns:
+        Dict with the same shape as get_meme_html
+    """
+    if aiohttp is None:
+        raise ImportError("aiohttp is required for the async API (pip install aiohttp)")
+
+    # Make sure the URL is valid and points to Know Your Meme
+    if not url.startswith("http"):
+        url = f"https://knowyourmeme.com{url}" if url.startswith("/") else f"https://knowyourmeme.com/{url}"
+
+    try:
+        async with session.get(url, headers=_DEFAULT_HEADERS, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            result = {
+                "html": await response.read(),
+                "status_code": response.status,
+                "url": str(response.url)
+            }
+
+            if response.status != 200:
+                result["error"] = f"Failed to fetch URL: HTTP {response.status}"
+
+            return result
+
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        # ClientTimeout expiry raises asyncio.TimeoutError, which is not a
+        # ClientError subclass - catch it too so timeouts come back as the
+        # same error dict the sync path returns
+        return {
+            "html": b"",
             "status_code": 0,
             "url": url,
             "error": f"Request error: {str(e)}"
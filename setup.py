@@ -10,15 +10,19 @@ setup(
     install_requires=[
         "requests>=2.25.0",
         "beautifulsoup4>=4.9.0",
-        "typing>=3.7.4.3",
+        "lxml>=4.6.0",
+        "selectolax>=0.3.0",
+        "brotli>=1.0.9",
+        "cachetools>=4.2.0",
+        "diskcache>=5.0.0",
+        "aiohttp>=3.8.0",
     ],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
 ) 
\ No newline at end of file